@@ -4,6 +4,7 @@ import gradio as gr
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Tuple
+from sqlalchemy.orm import joinedload
 
 from src.database.structured_store import StructuredStore, PersonDB, RelationshipDB, PartnershipDB
 from src.database.models import Person, Relationship, Partnership, ConfidenceLevel
@@ -33,10 +34,8 @@ class GenealogyDataEntry:
             if surname_filter.strip():
                 query = query.filter(PersonDB.surname.ilike(f"%{surname_filter.strip()}%"))
 
-            people = query.order_by(PersonDB.generation, PersonDB.surname, PersonDB.given_name).all()
-
-            if not people:
-                return pd.DataFrame(columns=["ID", "Gen", "Given Name", "Middle", "Surname", "Maiden Name", "Birth Year", "Death Year", "Confidence"])
+            # Stream the rows in batches rather than loading every person first
+            people = query.order_by(PersonDB.generation, PersonDB.surname, PersonDB.given_name).yield_per(500)
 
             data = []
             for p in people:
@@ -52,8 +51,19 @@ class GenealogyDataEntry:
                     "Confidence": p.confidence.value if p.confidence else ""
                 })
 
+            if not data:
+                return pd.DataFrame(columns=["ID", "Gen", "Given Name", "Middle", "Surname", "Maiden Name", "Birth Year", "Death Year", "Confidence"])
+
             return pd.DataFrame(data)
 
+    @staticmethod
+    def _names_by_id(session, person_ids) -> dict:
+        """Look up "Given Surname" for a set of person IDs in one query."""
+        rows = session.query(PersonDB.id, PersonDB.given_name, PersonDB.surname).filter(
+            PersonDB.id.in_(person_ids)
+        )
+        return {person_id: f"{given_name} {surname}" for person_id, given_name, surname in rows}
+
     def get_relationships_df(self) -> pd.DataFrame:
         """Get all relationships as a DataFrame."""
         with self.store.get_session() as session:
@@ -62,13 +72,12 @@ class GenealogyDataEntry:
             if not rels:
                 return pd.DataFrame(columns=["ID", "Parent ID", "Parent", "Child ID", "Child", "Type", "Confidence"])
 
+            names = self._names_by_id(session, {r.parent_id for r in rels} | {r.child_id for r in rels})
+
             data = []
             for r in rels:
-                parent = session.query(PersonDB).filter(PersonDB.id == r.parent_id).first()
-                child = session.query(PersonDB).filter(PersonDB.id == r.child_id).first()
-
-                parent_name = f"{parent.given_name} {parent.surname}" if parent else "Unknown"
-                child_name = f"{child.given_name} {child.surname}" if child else "Unknown"
+                parent_name = names.get(r.parent_id, "Unknown")
+                child_name = names.get(r.child_id, "Unknown")
 
                 data.append({
                     "ID": r.id,
@@ -90,13 +99,12 @@ class GenealogyDataEntry:
             if not parts:
                 return pd.DataFrame(columns=["ID", "Person 1 ID", "Person 1", "Person 2 ID", "Person 2", "Type", "Start Year", "End Year", "Sequence", "Confidence"])
 
+            names = self._names_by_id(session, {p.person1_id for p in parts} | {p.person2_id for p in parts})
+
             data = []
             for p in parts:
-                person1 = session.query(PersonDB).filter(PersonDB.id == p.person1_id).first()
-                person2 = session.query(PersonDB).filter(PersonDB.id == p.person2_id).first()
-
-                person1_name = f"{person1.given_name} {person1.surname}" if person1 else "Unknown"
-                person2_name = f"{person2.given_name} {person2.surname}" if person2 else "Unknown"
+                person1_name = names.get(p.person1_id, "Unknown")
+                person2_name = names.get(p.person2_id, "Unknown")
 
                 data.append({
                     "ID": p.id,
@@ -230,13 +238,13 @@ class GenealogyDataEntry:
         with self.store.get_session() as session:
             def get_parents(pid):
                 """Get all parents of a person."""
-                parent_rels = session.query(RelationshipDB).filter(RelationshipDB.child_id == pid).all()
-                parents = []
-                for rel in parent_rels:
-                    parent = session.query(PersonDB).filter(PersonDB.id == rel.parent_id).first()
-                    if parent:
-                        parents.append(parent)
-                return parents
+                parent_rels = (
+                    session.query(RelationshipDB)
+                    .options(joinedload(RelationshipDB.parent))
+                    .filter(RelationshipDB.child_id == pid)
+                    .all()
+                )
+                return [rel.parent for rel in parent_rels if rel.parent]
 
             def find_path_to_root(pid, visited=None):
                 """Recursively find all paths to root ancestors."""
@@ -486,11 +494,16 @@ class GenealogyDataEntry:
 
             with self.store.get_session() as session:
                 # Parents
-                parent_rels = session.query(RelationshipDB).filter(RelationshipDB.child_id == pid).all()
+                parent_rels = (
+                    session.query(RelationshipDB)
+                    .options(joinedload(RelationshipDB.parent))
+                    .filter(RelationshipDB.child_id == pid)
+                    .all()
+                )
                 if parent_rels:
                     details += "\n**Parents:**\n"
                     for rel in parent_rels:
-                        parent = session.query(PersonDB).filter(PersonDB.id == rel.parent_id).first()
+                        parent = rel.parent
                         if parent:
                             birth_death = ""
                             if parent.birth_year or parent.death_year:
@@ -542,11 +555,16 @@ class GenealogyDataEntry:
                             details += partner_info + "\n"
 
                 # Children
-                child_rels = session.query(RelationshipDB).filter(RelationshipDB.parent_id == pid).all()
+                child_rels = (
+                    session.query(RelationshipDB)
+                    .options(joinedload(RelationshipDB.child))
+                    .filter(RelationshipDB.parent_id == pid)
+                    .all()
+                )
                 if child_rels:
                     details += "\n**Children:**\n"
                     for rel in child_rels:
-                        child = session.query(PersonDB).filter(PersonDB.id == rel.child_id).first()
+                        child = rel.child
                         if child:
                             birth_death = ""
                             if child.birth_year or child.death_year:
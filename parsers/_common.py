@@ -0,0 +1,232 @@
+"""Shared helpers for the lineage population scripts."""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.database.models import ConfidenceLevel
+from src.database.structured_store import StructuredStore, BatchStore
+
+_CONFIRMED = ConfidenceLevel.CONFIRMED
+
+LINEAGE_DIR = Path(__file__).parent / "lineages"
+
+
+class LineagePerson(NamedTuple):
+    """One row of a declarative lineage table.
+
+    ``parents`` holds keys of earlier rows (or anchors); each parent gets a
+    biological relationship to this person.
+    """
+
+    key: str
+    given_name: str
+    middle_name: Optional[str]
+    surname: str
+    birth_year: Optional[int]
+    death_year: Optional[int]
+    generation: Optional[int]
+    confidence: ConfidenceLevel
+    parents: Tuple[str, ...] = ()
+    maiden_name: Optional[str] = None
+
+
+class ProgressLog:
+    """Per-row progress lines, written in one go at the end.
+
+    Lines are only kept when the ``VERBOSE`` environment variable is set,
+    so a normal run prints just the headers and summary.
+    """
+
+    def __init__(self):
+        self.enabled = bool(os.environ.get("VERBOSE"))
+        self._lines: List[str] = []
+
+    def add(self, line: str):
+        if self.enabled:
+            self._lines.append(line)
+
+    def flush(self):
+        """Write the collected lines with a single ``write`` call."""
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+
+
+def format_person(person: LineagePerson) -> str:
+    """Format a lineage row as "Given Middle Surname [birth-death]"."""
+    name = " ".join(p for p in (person.given_name, person.middle_name, person.surname) if p)
+    if person.birth_year or person.death_year:
+        name += f" [{person.birth_year or ''}-{person.death_year or ''}]"
+    return name
+
+
+def read_lineage_file(path: Path) -> Tuple[Dict[str, int], List[LineagePerson], List[tuple]]:
+    """Read a lineage data file into the tables ``load_lineage`` expects.
+
+    The file is JSON with ``anchors`` (key -> name and birth year of a person
+    already in the database), ``people`` and ``partnerships`` lists; see
+    ``lineages/mary_keenum.json``. Resolve the anchors with ``resolve_anchors``.
+
+    Args:
+        path: Path to the lineage file
+
+    Returns:
+        Tuple of (anchors, people, partnerships)
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    people = [
+        LineagePerson(
+            key=row["key"],
+            given_name=row["given"],
+            middle_name=row.get("middle"),
+            surname=row["surname"],
+            birth_year=row.get("birth"),
+            death_year=row.get("death"),
+            generation=row.get("generation"),
+            confidence=ConfidenceLevel[row["confidence"]],
+            parents=tuple(row.get("parents", ())),
+            maiden_name=row.get("maiden"),
+        )
+        for row in data["people"]
+    ]
+    partnerships = [
+        (
+            row["person1"],
+            row["person2"],
+            row.get("type", "marriage"),
+            row.get("start_year"),
+            ConfidenceLevel[row["confidence"]],
+        )
+        for row in data.get("partnerships", [])
+    ]
+    return data["anchors"], people, partnerships
+
+
+def resolve_anchors(store: StructuredStore, anchors: Dict[str, dict]) -> Dict[str, int]:
+    """Look up the person ID of each anchor in a lineage file.
+
+    Anchors are people an earlier lineage script adds, so they are only
+    looked up (in one query), never created.
+
+    Args:
+        store: Structured store to look the anchors up in
+        anchors: Key -> ``{"given", "surname", "middle", "birth"}`` of existing people
+
+    Returns:
+        Mapping of anchor key to person ID
+
+    Raises:
+        ValueError: If an anchor is not in the database
+    """
+    names = {
+        key: (spec["given"], spec["surname"], spec.get("middle"), spec.get("birth"))
+        for key, spec in anchors.items()
+    }
+    found = store.find_person_ids(names.values())
+
+    missing = [
+        " ".join(part for part in (given, middle, surname) if part) + (f" (b. {birth})" if birth else "")
+        for given, surname, middle, birth in names.values()
+        if (given, surname, middle, birth) not in found
+    ]
+    if missing:
+        raise ValueError(
+            f"Anchor people not in the database: {', '.join(missing)}. "
+            "Populate the lineage that adds them first."
+        )
+    return {key: found[name] for key, name in names.items()}
+
+
+def load_lineage(
+    batch: BatchStore,
+    people: Sequence[tuple],
+    partnerships: Sequence[tuple],
+    anchors: Dict[str, int],
+) -> Dict[str, int]:
+    """Queue a declarative lineage table on a batch.
+
+    People, relationships and partnerships that are already in the database
+    are reused rather than queued again, so re-running a script is a no-op.
+
+    Per-person "Added ..." lines are only built when the ``VERBOSE``
+    environment variable is set, and are written in one go at the end.
+
+    Args:
+        batch: Batch the rows are queued on
+        people: ``LineagePerson`` rows (or same-shaped tuples), parents before children
+        partnerships: ``(key1, key2, partnership_type, start_year, confidence)`` tuples
+        anchors: Keys of people already in the database, mapped to their IDs
+
+    Returns:
+        Mapping of every key (anchors included) to its person ID
+    """
+    ids = dict(anchors)
+    log = ProgressLog()
+
+    # Bound once rather than looked up for every row
+    find_person = batch.find_person
+    add_person = batch.add_person
+    add_relationship = batch.add_relationship
+    confirmed = _CONFIRMED
+
+    for row in people:
+        person = LineagePerson(*row)
+        person_id = find_person(
+            person.given_name,
+            person.surname,
+            middle_name=person.middle_name,
+            birth_year=person.birth_year,
+            death_year=person.death_year,
+            generation=person.generation,
+        )
+        if person_id is None:
+            person_id = add_person(
+                person.given_name,
+                person.surname,
+                middle_name=person.middle_name,
+                maiden_name=person.maiden_name,
+                birth_year=person.birth_year,
+                death_year=person.death_year,
+                generation=person.generation,
+                confidence=person.confidence,
+            )
+            if log.enabled:
+                log.add(f"Added {format_person(person)} (ID: {person_id})")
+        ids[person.key] = person_id
+
+        for parent in person.parents:
+            add_relationship(ids[parent], person_id, "biological", confirmed)
+
+    for key1, key2, partnership_type, start_year, confidence in partnerships:
+        batch.add_partnership(
+            ids[key1], ids[key2], partnership_type, start_year=start_year, confidence=confidence
+        )
+
+    log.flush()
+
+    return ids
+
+
+def print_db_stats(store: StructuredStore, lineage_summary_lines: Iterable[str] = ()):
+    """Print table totals followed by a per-lineage summary.
+
+    Args:
+        store: Structured store the lineage was written to
+        lineage_summary_lines: Summary lines printed (indented) after the totals
+    """
+    counts = store.get_table_counts()
+
+    print(f"  Total People: {counts['people']}")
+    print(f"  Total Relationships: {counts['relationships']}")
+    print(f"  Total Partnerships: {counts['partnerships']}")
+
+    lineage_summary_lines = list(lineage_summary_lines)
+    if lineage_summary_lines:
+        print()
+        for line in lineage_summary_lines:
+            print(f"  {line}")
@@ -1,11 +1,12 @@
 """Parser for John Keenum lineage data from PDF pages 143-146."""
 
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents a person in the lineage."""
     given_name: str
@@ -155,7 +156,6 @@ def main():
     print(f"Parsed {len(persons)} people\n")
 
     # Show summary by generation
-    from collections import Counter
     gen_counts = Counter(p.generation for p in persons)
 
     print("People by generation:")
@@ -7,6 +7,13 @@ from typing import List, Tuple, Optional
 class LineagePerson:
     """Represents a person in the lineage."""
 
+    # A lineage holds hundreds of these; slots keep them free of a per-instance dict
+    __slots__ = (
+        "generation", "given_name", "middle_name", "surname", "maiden_name",
+        "birth_year", "death_year", "is_spouse", "notes", "parent_index",
+        "partner_index",
+    )
+
     def __init__(self, generation: int, given_name: str, middle_name: str, surname: str,
                  maiden_name: str, birth_year: Optional[int], death_year: Optional[int],
                  is_spouse: bool, notes: str = ""):
@@ -20,6 +27,7 @@ class LineagePerson:
         self.is_spouse = is_spouse
         self.notes = notes
         self.parent_index = None  # Will be set during parsing
+        self.partner_index = None  # Set on spouses by link_partners
 
     def __repr__(self):
         years = ""
@@ -207,9 +215,37 @@ def parse_lineage_file(filename: str) -> List[LineagePerson]:
         persons.append(person)
         i += 1
 
+    link_partners(persons)
     return persons
 
 
+def link_partners(persons: List[LineagePerson]):
+    """Set ``partner_index`` on each spouse to the index of the person they married.
+
+    A spouse is matched to the person right before them, else to the last
+    non-spouse person of their generation, else (a later marriage listed
+    after the children) to the last non-spouse person one generation up,
+    if that person is at most 21 entries back.
+    """
+    last_nonspouse = None
+    last_nonspouse_by_gen = {}
+
+    for i, person in enumerate(persons):
+        if not person.is_spouse:
+            last_nonspouse = i
+            last_nonspouse_by_gen[person.generation] = i
+            continue
+
+        if i > 0 and not persons[i-1].is_spouse and persons[i-1].generation == person.generation:
+            person.partner_index = i - 1
+        elif last_nonspouse is not None and persons[last_nonspouse].generation == person.generation:
+            person.partner_index = last_nonspouse
+        elif person.generation is not None and person.generation > 1:
+            j = last_nonspouse_by_gen.get(person.generation - 1)
+            if j is not None and i - j <= 21:
+                person.partner_index = j
+
+
 def main():
     """Main function to parse and display the lineage."""
     persons = parse_lineage_file('stephen_lineage_raw.txt')
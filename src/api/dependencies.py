@@ -1,10 +1,10 @@
 """FastAPI dependencies for database connections and settings."""
 
-from typing import Generator
 from functools import lru_cache
 
 from sqlalchemy.orm import Session
 
+from ..utils.cache import TTLCache
 from ..utils.config import Settings, get_settings
 from ..database.structured_store import StructuredStore
 from ..visualizations.graph_builder import FamilyGraphBuilder
@@ -20,25 +20,46 @@ def get_api_settings() -> Settings:
     return get_settings()
 
 
-def get_structured_store() -> Generator[StructuredStore, None, None]:
-    """Get StructuredStore instance for dependency injection.
+@lru_cache()
+def get_structured_store() -> StructuredStore:
+    """Get the shared StructuredStore instance for dependency injection.
+
+    Built once, so every request reuses the same engine and connection pool.
 
-    Yields:
-        StructuredStore instance
+    Returns:
+        Cached StructuredStore instance
     """
-    settings = get_api_settings()
-    store = StructuredStore(settings)
-    try:
-        yield store
-    finally:
-        pass  # StructuredStore manages its own connections
+    return StructuredStore(get_api_settings())
 
 
+@lru_cache()
 def get_graph_builder() -> FamilyGraphBuilder:
-    """Get FamilyGraphBuilder instance.
+    """Get the shared FamilyGraphBuilder instance.
+
+    Reads through the shared store, so the API keeps a single connection pool.
 
     Returns:
-        FamilyGraphBuilder instance
+        Cached FamilyGraphBuilder instance
     """
     settings = get_api_settings()
-    return FamilyGraphBuilder(settings)
+    return FamilyGraphBuilder(settings, store=get_structured_store())
+
+
+@lru_cache()
+def get_lineage_cache() -> TTLCache:
+    """Get the shared cache of lineage path responses, keyed by write generation and person ID.
+
+    Returns:
+        Cached TTLCache instance
+    """
+    return TTLCache(maxsize=4096, ttl=get_api_settings().api_cache_ttl)
+
+
+@lru_cache()
+def get_graph_cache() -> TTLCache:
+    """Get the shared cache of serialized graph responses, keyed by write generation and query parameters.
+
+    Returns:
+        Cached TTLCache instance
+    """
+    return TTLCache(maxsize=256, ttl=get_api_settings().api_cache_ttl)
@@ -1,19 +1,33 @@
 """FastAPI routes for genealogy data."""
 
+from collections import defaultdict
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field
+from sqlalchemy import select, text
 import networkx as nx
 
-from .dependencies import get_graph_builder, get_structured_store
+from .dependencies import get_graph_builder, get_graph_cache, get_lineage_cache, get_structured_store
 from ..visualizations.graph_builder import FamilyGraphBuilder
-from ..database.structured_store import StructuredStore
+from ..database.structured_store import StructuredStore, PersonDB, RelationshipDB, PartnershipDB
+from ..utils.cache import TTLCache
+
+
+# Lineage relationship descriptions indexed by generations from the root
+# ancestor; deeper paths are spelled out on the fly
+_RELATION_TABLE = ["self (root ancestor)", "child", "grandchild"] + [
+    f"{'great-' * (i - 2)}grandchild" for i in range(3, 21)
+]
 
 
 # ============================================================================
 # Response Models (Pydantic)
 # ============================================================================
 
+# List items (search results, graph nodes/edges, relatives, lineage steps)
+# are built with model_construct: their values come straight from database
+# rows, so per-field validation is skipped on these hot loops.
+
 class PersonResponse(BaseModel):
     """Person data response model."""
     id: int
@@ -149,11 +163,9 @@ async def health_check(
         Health status
     """
     try:
-        # Test database connection by counting persons
-        session = store.Session()
-        from ..database.structured_store import Person
-        count = session.query(Person).count()
-        session.close()
+        # Test the database connection with a constant-time round trip
+        with store.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
 
         return HealthResponse(
             status="healthy",
@@ -188,24 +200,25 @@ async def search_people(
         Search results with metadata
     """
     try:
-        # Use graph builder's search
-        results = builder.search_people(q)
+        # Only the requested page is read; the total is a separate COUNT
+        results = builder.search_people(q, limit=limit, offset=offset)
+        total = builder.count_search_matches(q)
 
         # Convert to response model
         search_results = [
-            SearchResultResponse(
+            SearchResultResponse.model_construct(
                 id=r["id"],
                 name=r["name"],
                 birth_year=r.get("birth_year"),
                 death_year=r.get("death_year"),
                 relevance=1.0  # Could add relevance scoring later
             )
-            for r in results[offset:offset+limit]
+            for r in results
         ]
 
         return SearchResponse(
             results=search_results,
-            total=len(results),
+            total=total,
             limit=limit,
             offset=offset
         )
@@ -242,29 +255,17 @@ async def get_person(
         Person details
     """
     try:
-        from ..database.structured_store import PersonDB
-
         with store.get_session() as session:
             person = session.query(PersonDB).filter(PersonDB.id == person_id).first()
 
             if not person:
                 raise HTTPException(status_code=404, detail=f"Person {person_id} not found")
 
-            # Build full name
-            full_name_parts = []
-            if person.given_name:
-                full_name_parts.append(person.given_name)
-            if person.middle_name:
-                full_name_parts.append(person.middle_name)
-            if person.surname:
-                full_name_parts.append(person.surname)
-            full_name = " ".join(full_name_parts) if full_name_parts else "Unknown"
-
             return PersonResponse(
                 id=person.id,
                 given_name=person.given_name,
                 surname=person.surname,
-                full_name=full_name,
+                full_name=person.full_name,
                 birth_year=person.birth_year,
                 death_year=person.death_year,
                 birth_place=None,  # Not in database
@@ -285,10 +286,15 @@ async def get_family_graph(
     include_ancestors: bool = Query(True, description="Include ancestors"),
     include_descendants: bool = Query(True, description="Include descendants"),
     surname_filter: Optional[str] = Query(None, description="Filter by surname"),
-    builder: FamilyGraphBuilder = Depends(get_graph_builder)
+    builder: FamilyGraphBuilder = Depends(get_graph_builder),
+    cache: TTLCache = Depends(get_graph_cache)
 ) -> GraphResponse:
     """Get family tree graph data.
 
+    The serialized JSON is cached per set of query parameters until the
+    next write to the database (at most ``API_CACHE_TTL`` seconds) and sent
+    as-is on a repeat request.
+
     Args:
         root_id: Root person ID (optional, returns all if not specified)
         generations: Maximum generations to include (1-10)
@@ -299,6 +305,14 @@ async def get_family_graph(
     Returns:
         Graph data with nodes, edges, and metadata
     """
+    key = (
+        builder.store.write_generation(),
+        root_id, generations, include_ancestors, include_descendants, surname_filter,
+    )
+    content = cache.get(key)
+    if content is not None:
+        return Response(content=content, media_type="application/json")
+
     try:
         # Build graph using existing builder
         G = builder.build_graph(
@@ -309,14 +323,18 @@ async def get_family_graph(
             surname_filter=surname_filter
         )
 
-        # Convert nodes to response format
+        # Convert nodes to response format, collecting unique surnames
+        # in the same pass
         nodes = []
-        for node_id in G.nodes:
-            node_data = G.nodes[node_id]
-            nodes.append(GraphNodeResponse(
+        surnames = set()
+        for node_id, node_data in G.nodes(data=True):
+            surname = node_data.get("surname")
+            if surname:
+                surnames.add(surname)
+            nodes.append(GraphNodeResponse.model_construct(
                 id=node_id,
                 given_name=node_data.get("given_name"),
-                surname=node_data.get("surname"),
+                surname=surname,
                 full_name=node_data.get("full_name", "Unknown"),
                 birth_year=node_data.get("birth_year"),
                 death_year=node_data.get("death_year"),
@@ -327,37 +345,32 @@ async def get_family_graph(
 
         # Convert edges to response format
         edges = []
-        for source, target in G.edges:
-            edge_data = G.edges[source, target]
-            edges.append(GraphEdgeResponse(
+        for source, target, edge_data in G.edges(data=True):
+            edges.append(GraphEdgeResponse.model_construct(
                 source=source,
                 target=target,
                 relationship_type=edge_data.get("relationship_type", "related_to")
             ))
 
-        # Collect unique surnames
-        surnames = set()
-        for node_id in G.nodes:
-            surname = G.nodes[node_id].get("surname")
-            if surname:
-                surnames.add(surname)
-
         # Create metadata
         metadata = GraphMetadataResponse(
             total_nodes=len(G.nodes),
             total_edges=len(G.edges),
             max_depth=generations,
-            surnames=sorted(list(surnames))
+            surnames=sorted(surnames)
         )
 
-        return GraphResponse(
+        content = GraphResponse(
             nodes=nodes,
             edges=edges,
             metadata=metadata
-        )
+        ).model_dump_json().encode()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    cache.set(key, content)
+    return Response(content=content, media_type="application/json")
+
 
 @router.get("/genealogy/relationships/{person_id}", response_model=List[RelationshipResponse], tags=["genealogy"])
 async def get_relationships(
@@ -373,27 +386,32 @@ async def get_relationships(
         List of relationships
     """
     try:
-        from ..database.structured_store import PersonDB, RelationshipDB
-
         with store.get_session() as session:
             # Check if person exists
             person = session.query(PersonDB).filter(PersonDB.id == person_id).first()
             if not person:
                 raise HTTPException(status_code=404, detail=f"Person {person_id} not found")
 
-            # Get all relationships where person is either parent or child
-            relationships = session.query(RelationshipDB).filter(
-                (RelationshipDB.parent_id == person_id) |
-                (RelationshipDB.child_id == person_id)
-            ).all()
+            # Get all relationships where person is either parent or child,
+            # reading just the three columns the response needs
+            relationships = session.execute(
+                select(
+                    RelationshipDB.parent_id,
+                    RelationshipDB.child_id,
+                    RelationshipDB.relationship_type,
+                ).where(
+                    (RelationshipDB.parent_id == person_id) |
+                    (RelationshipDB.child_id == person_id)
+                )
+            )
 
             # Convert to response format
             result = []
-            for rel in relationships:
-                result.append(RelationshipResponse(
-                    source=rel.parent_id,
-                    target=rel.child_id,
-                    relationship_type=rel.relationship_type
+            for parent_id, child_id, relationship_type in relationships:
+                result.append(RelationshipResponse.model_construct(
+                    source=parent_id,
+                    target=child_id,
+                    relationship_type=relationship_type
                 ))
 
             return result
@@ -406,71 +424,99 @@ async def get_relationships(
 @router.get("/genealogy/lineage/{person_id}", response_model=LineagePathResponse, tags=["genealogy"])
 async def get_lineage_path(
     person_id: int,
-    store: StructuredStore = Depends(get_structured_store)
+    store: StructuredStore = Depends(get_structured_store),
+    cache: TTLCache = Depends(get_lineage_cache)
 ) -> LineagePathResponse:
     """Get lineage path from person to their earliest Keenum ancestor.
 
+    Paths are cached per person until the next write to the database (at
+    most ``API_CACHE_TTL`` seconds).
+
     Args:
         person_id: Person ID
 
     Returns:
         Lineage path with ancestor relationship description
     """
-    try:
-        from ..database.structured_store import PersonDB, RelationshipDB
+    key = (store.write_generation(), person_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
 
+    try:
         with store.get_session() as session:
             # Check if person exists
             person = session.query(PersonDB).filter(PersonDB.id == person_id).first()
             if not person:
                 raise HTTPException(status_code=404, detail=f"Person {person_id} not found")
 
+            # Fetch every parent link above this person with one recursive
+            # query, then everyone on those links with one more
+            edges = (
+                select(RelationshipDB.id, RelationshipDB.child_id, RelationshipDB.parent_id)
+                .where(RelationshipDB.child_id == person_id)
+                .cte("ancestor_edges", recursive=True)
+            )
+            edges = edges.union(
+                select(RelationshipDB.id, RelationshipDB.child_id, RelationshipDB.parent_id)
+                .join(edges, RelationshipDB.child_id == edges.c.parent_id)
+            )
+            parent_ids = defaultdict(list)
+            for _, child_id, parent_id in session.execute(select(edges).order_by(edges.c.id)):
+                parent_ids[child_id].append(parent_id)
+
+            # The Keenum surname test runs in the same query
+            ancestor_ids = {person_id}.union(*parent_ids.values())
+            people = {}
+            keenum_ids = set()
+            for p, is_keenum in session.query(PersonDB, PersonDB.surname.ilike("%keenum%")).filter(
+                PersonDB.id.in_(ancestor_ids)
+            ):
+                people[p.id] = p
+                if is_keenum:
+                    keenum_ids.add(p.id)
+
+            # Without any Keenum among the ancestors no path can qualify
+            if not keenum_ids:
+                raise HTTPException(status_code=404, detail="No Keenum ancestor found for this person")
+
             def get_parents(pid):
                 """Get all parents of a person."""
-                parent_rels = session.query(RelationshipDB).filter(RelationshipDB.child_id == pid).all()
-                parents = []
-                for rel in parent_rels:
-                    parent = session.query(PersonDB).filter(PersonDB.id == rel.parent_id).first()
-                    if parent:
-                        parents.append(parent)
-                return parents
-
-            def find_path_to_root(pid, visited=None):
-                """Recursively find all paths to root ancestors."""
-                if visited is None:
-                    visited = set()
-
-                if pid in visited:
-                    return []
-
-                visited.add(pid)
-                person = session.query(PersonDB).filter(PersonDB.id == pid).first()
-                if not person:
-                    return []
-
-                parents = get_parents(pid)
-
-                # If no parents, this is a root ancestor
-                if not parents:
-                    return [[person]]
-
-                # Recursively find paths through each parent
-                all_paths = []
-                for parent in parents:
-                    parent_paths = find_path_to_root(parent.id, visited.copy())
-                    for path in parent_paths:
-                        all_paths.append(path + [person])
-
-                return all_paths
+                return [people[parent_id] for parent_id in parent_ids[pid] if parent_id in people]
+
+            def find_paths_to_root(start_id):
+                """Yield every path from a root ancestor down to ``start_id``.
+
+                Walks depth-first with an explicit stack, taking parents in
+                relationship order, so paths come out in the same order as a
+                recursive walk. Each stack entry carries the IDs on its own
+                path, which is all that is needed to skip cycles.
+                """
+                if start_id not in people:
+                    return
+
+                stack = [(start_id, (start_id,))]
+                while stack:
+                    pid, path = stack.pop()
+                    parents = get_parents(pid)
+
+                    # If no parents, this is a root ancestor
+                    if not parents:
+                        yield [people[i] for i in reversed(path)]
+                        continue
+
+                    for parent in reversed(parents):
+                        if parent.id not in path:
+                            stack.append((parent.id, path + (parent.id,)))
 
             # Find all paths to root ancestors
-            all_paths = find_path_to_root(person_id)
+            all_paths = find_paths_to_root(person_id)
 
             # Filter for paths that lead to Keenum ancestors
             keenum_paths = []
             for path in all_paths:
                 # Check if the root (first person in path) is a Keenum
-                if path and path[0].surname and 'keenum' in path[0].surname.lower():
+                if path[0].id in keenum_ids:
                     keenum_paths.append(path)
 
             if not keenum_paths:
@@ -496,7 +542,7 @@ async def get_lineage_path(
 
             # Convert to response format
             lineage_persons = [
-                LineagePersonResponse(
+                LineagePersonResponse.model_construct(
                     id=p.id,
                     name=f"{p.given_name} {p.surname}",
                     generation=p.generation or 0,
@@ -508,19 +554,10 @@ async def get_lineage_path(
 
             # Calculate relationship description
             generations_from_ancestor = len(earliest_path) - 1
-            if generations_from_ancestor == 0:
-                relationship = "self (root ancestor)"
-            elif generations_from_ancestor == 1:
-                relationship = "child"
-            elif generations_from_ancestor == 2:
-                relationship = "grandchild"
-            elif generations_from_ancestor == 3:
-                relationship = "great-grandchild"
-            elif generations_from_ancestor > 3:
-                greats = "great-" * (generations_from_ancestor - 2)
-                relationship = f"{greats}grandchild"
+            if generations_from_ancestor < len(_RELATION_TABLE):
+                relationship = _RELATION_TABLE[generations_from_ancestor]
             else:
-                relationship = "unknown"
+                relationship = f"{'great-' * (generations_from_ancestor - 2)}grandchild"
 
             ancestor_name = earliest_path[0].given_name + " " + earliest_path[0].surname
             if generations_from_ancestor > 0:
@@ -528,7 +565,7 @@ async def get_lineage_path(
             else:
                 relationship_desc = f"This person is a root Keenum ancestor"
 
-            return LineagePathResponse(
+            response = LineagePathResponse(
                 path=lineage_persons,
                 relationship_description=relationship_desc,
                 generations_from_ancestor=generations_from_ancestor
@@ -539,6 +576,9 @@ async def get_lineage_path(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    cache.set(key, response)
+    return response
+
 
 @router.get("/genealogy/family/{person_id}", response_model=DirectFamilyResponse, tags=["genealogy"])
 async def get_direct_family(
@@ -554,21 +594,53 @@ async def get_direct_family(
         Direct family relationships
     """
     try:
-        from ..database.structured_store import PersonDB, RelationshipDB, PartnershipDB
-
         with store.get_session() as session:
             # Check if person exists
             person = session.query(PersonDB).filter(PersonDB.id == person_id).first()
             if not person:
                 raise HTTPException(status_code=404, detail=f"Person {person_id} not found")
 
-            # Get parents
-            parents = []
+            # Collect the relationship rows first, then load every relative
+            # they mention with a single query
             parent_rels = session.query(RelationshipDB).filter(RelationshipDB.child_id == person_id).all()
+
+            # Siblings are people who share at least one parent; fetch the
+            # children of every parent in one query
+            siblings_set = set()
+            if parent_rels:
+                siblings_set = set(session.scalars(
+                    select(RelationshipDB.child_id).where(
+                        RelationshipDB.parent_id.in_({rel.parent_id for rel in parent_rels}),
+                        RelationshipDB.child_id != person_id
+                    ).distinct()
+                ))
+
+            partnerships = session.query(PartnershipDB).filter(
+                (PartnershipDB.person1_id == person_id) | (PartnershipDB.person2_id == person_id)
+            ).all()
+            partner_ids = [
+                part.person2_id if part.person1_id == person_id else part.person1_id
+                for part in partnerships
+            ]
+
+            child_rels = session.query(RelationshipDB).filter(RelationshipDB.parent_id == person_id).all()
+
+            relative_ids = (
+                {rel.parent_id for rel in parent_rels}
+                | siblings_set
+                | set(partner_ids)
+                | {rel.child_id for rel in child_rels}
+            )
+            relatives = {
+                p.id: p for p in session.query(PersonDB).filter(PersonDB.id.in_(relative_ids))
+            }
+
+            # Parents
+            parents = []
             for rel in parent_rels:
-                parent = session.query(PersonDB).filter(PersonDB.id == rel.parent_id).first()
+                parent = relatives.get(rel.parent_id)
                 if parent:
-                    parents.append(FamilyMemberResponse(
+                    parents.append(FamilyMemberResponse.model_construct(
                         id=parent.id,
                         name=f"{parent.given_name} {parent.surname}",
                         relationship=rel.relationship_type,
@@ -576,38 +648,23 @@ async def get_direct_family(
                         death_year=parent.death_year
                     ))
 
-            # Get siblings (people who share at least one parent)
+            # Siblings
             siblings = []
-            if parent_rels:
-                siblings_set = set()
-                for parent_rel in parent_rels:
-                    sibling_rels = session.query(RelationshipDB).filter(
-                        RelationshipDB.parent_id == parent_rel.parent_id,
-                        RelationshipDB.child_id != person_id
-                    ).all()
-                    for sib_rel in sibling_rels:
-                        siblings_set.add(sib_rel.child_id)
-
-                for sib_id in sorted(siblings_set):
-                    sibling = session.query(PersonDB).filter(PersonDB.id == sib_id).first()
-                    if sibling:
-                        siblings.append(FamilyMemberResponse(
-                            id=sibling.id,
-                            name=f"{sibling.given_name} {sibling.surname}",
-                            relationship="sibling",
-                            birth_year=sibling.birth_year,
-                            death_year=sibling.death_year
-                        ))
-
-            # Get spouses/partners
-            spouses = []
-            partnerships = session.query(PartnershipDB).filter(
-                (PartnershipDB.person1_id == person_id) | (PartnershipDB.person2_id == person_id)
-            ).all()
+            for sib_id in sorted(siblings_set):
+                sibling = relatives.get(sib_id)
+                if sibling:
+                    siblings.append(FamilyMemberResponse.model_construct(
+                        id=sibling.id,
+                        name=f"{sibling.given_name} {sibling.surname}",
+                        relationship="sibling",
+                        birth_year=sibling.birth_year,
+                        death_year=sibling.death_year
+                    ))
 
-            for part in partnerships:
-                other_id = part.person2_id if part.person1_id == person_id else part.person1_id
-                other = session.query(PersonDB).filter(PersonDB.id == other_id).first()
+            # Spouses/partners
+            spouses = []
+            for part, other_id in zip(partnerships, partner_ids):
+                other = relatives.get(other_id)
                 if other:
                     additional_info = []
                     if part.start_year:
@@ -617,7 +674,7 @@ async def get_direct_family(
                     if part.sequence_number:
                         additional_info.append(f"marriage #{part.sequence_number}")
 
-                    spouses.append(FamilyMemberResponse(
+                    spouses.append(FamilyMemberResponse.model_construct(
                         id=other.id,
                         name=f"{other.given_name} {other.surname}",
                         relationship=part.partnership_type,
@@ -626,13 +683,12 @@ async def get_direct_family(
                         additional_info=" - ".join(additional_info) if additional_info else None
                     ))
 
-            # Get children
+            # Children
             children = []
-            child_rels = session.query(RelationshipDB).filter(RelationshipDB.parent_id == person_id).all()
             for rel in child_rels:
-                child = session.query(PersonDB).filter(PersonDB.id == rel.child_id).first()
+                child = relatives.get(rel.child_id)
                 if child:
-                    children.append(FamilyMemberResponse(
+                    children.append(FamilyMemberResponse.model_construct(
                         id=child.id,
                         name=f"{child.given_name} {child.surname}",
                         relationship=rel.relationship_type,
@@ -11,7 +11,7 @@ from .models import (
     RetrievalResult,
     GenealogyResponse,
 )
-from .structured_store import StructuredStore
+from .structured_store import StructuredStore, BatchStore, get_default_store
 
 __all__ = [
     "Person",
@@ -24,4 +24,6 @@ __all__ = [
     "RetrievalResult",
     "GenealogyResponse",
     "StructuredStore",
+    "BatchStore",
+    "get_default_store",
 ]
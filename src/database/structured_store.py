@@ -1,8 +1,11 @@
 """Structured database for genealogical facts and relationships."""
 
+import threading
+from contextlib import contextmanager
 from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from sqlalchemy import (
     create_engine,
     Column,
@@ -11,12 +14,18 @@ from sqlalchemy import (
     Date,
     Float,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
+    event,
+    func,
+    insert,
+    select,
+    tuple_,
 )
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship, Session
+from sqlalchemy.orm import declarative_base, sessionmaker, relationship, Session, column_property
 
-from .models import ConfidenceLevel
-from ..utils.config import Settings
+from .models import ConfidenceLevel, Person
+from ..utils.config import Settings, get_settings
 
 Base = declarative_base()
 
@@ -36,6 +45,15 @@ class PersonDB(Base):
     generation = Column(Integer, nullable=True)
     confidence = Column(SQLEnum(ConfidenceLevel), default=ConfidenceLevel.UNCERTAIN)
 
+    # "Given Middle Surname", built by the database in the same SELECT
+    # (a blank middle name is skipped like a missing one)
+    full_name = column_property(
+        given_name + " " + func.coalesce(func.nullif(middle_name, "") + " ", "") + surname
+    )
+
+    # Exact name lookups (find_person_ids, find_person_by_name)
+    __table_args__ = (Index("ix_people_surname_given", "surname", "given_name"),)
+
 
 class RelationshipDB(Base):
     """Parent-child relationship table."""
@@ -43,11 +61,14 @@ class RelationshipDB(Base):
     __tablename__ = "relationships"
 
     id = Column(Integer, primary_key=True)
-    parent_id = Column(Integer, ForeignKey("people.id"), nullable=False)
-    child_id = Column(Integer, ForeignKey("people.id"), nullable=False)
+    parent_id = Column(Integer, ForeignKey("people.id"), nullable=False, index=True)
+    child_id = Column(Integer, ForeignKey("people.id"), nullable=False, index=True)
     relationship_type = Column(String, nullable=False)  # biological, adoptive, step
     confidence = Column(SQLEnum(ConfidenceLevel), default=ConfidenceLevel.UNCERTAIN)
 
+    parent = relationship(PersonDB, foreign_keys=[parent_id])
+    child = relationship(PersonDB, foreign_keys=[child_id])
+
 
 class PartnershipDB(Base):
     """Partnership/Marriage table."""
@@ -55,8 +76,8 @@ class PartnershipDB(Base):
     __tablename__ = "partnerships"
 
     id = Column(Integer, primary_key=True)
-    person1_id = Column(Integer, ForeignKey("people.id"), nullable=False)
-    person2_id = Column(Integer, ForeignKey("people.id"), nullable=False)
+    person1_id = Column(Integer, ForeignKey("people.id"), nullable=False, index=True)
+    person2_id = Column(Integer, ForeignKey("people.id"), nullable=False, index=True)
     partnership_type = Column(String, nullable=False)  # marriage, partnership
     start_year = Column(Integer, nullable=True)
     end_year = Column(Integer, nullable=True)
@@ -64,6 +85,20 @@ class PartnershipDB(Base):
     confidence = Column(SQLEnum(ConfidenceLevel), default=ConfidenceLevel.UNCERTAIN)
 
 
+class WriteGenerationDB(Base):
+    """Single-row counter of changes to people, relationships and partnerships.
+
+    Bumped by triggers (see ``StructuredStore._create_write_triggers``), so
+    it also counts writes made by other processes or outside the store's
+    methods. Caches of derived data key on it to drop stale results.
+    """
+
+    __tablename__ = "write_generation"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+
+
 class CitationDB(Base):
     """Citation table."""
 
@@ -84,7 +119,7 @@ class FactDB(Base):
     __tablename__ = "facts"
 
     id = Column(Integer, primary_key=True)
-    person_id = Column(Integer, ForeignKey("people.id"), nullable=False)
+    person_id = Column(Integer, ForeignKey("people.id"), nullable=False, index=True)
     fact_type = Column(String, nullable=False)
     date = Column(Date, nullable=True)
     place = Column(String, nullable=True)
@@ -93,6 +128,29 @@ class FactDB(Base):
     citation_id = Column(Integer, ForeignKey("citations.id"), nullable=True)
 
 
+# One INSERT construct per table, reused by StructuredStore._insert
+_INSERTS = {
+    table.name: insert(table)
+    for table in (PersonDB.__table__, RelationshipDB.__table__, PartnershipDB.__table__)
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record, synchronous: str = "NORMAL"):
+    """Tune each new SQLite connection for bulk writes.
+
+    WAL lets readers continue while a writer commits, and with
+    ``synchronous=NORMAL`` a commit no longer waits on an fsync (a power
+    loss can drop the last transactions but never corrupts the file).
+    Set ``SQLITE_SYNCHRONOUS=FULL`` to make every commit durable instead.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={synchronous}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+
 class StructuredStore:
     """Interface for structured genealogy database."""
 
@@ -107,16 +165,140 @@ class StructuredStore:
 
         # Create engine and session
         db_url = f"sqlite:///{self.settings.structured_db_path}"
-        self.engine = create_engine(db_url, echo=False)
+        self.engine = create_engine(
+            db_url,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=self.settings.db_pool_size,
+        )
+        event.listen(
+            self.engine,
+            "connect",
+            partial(_set_sqlite_pragmas, synchronous=self.settings.sqlite_synchronous),
+        )
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
+        self._create_write_triggers()
 
         self.SessionLocal = sessionmaker(bind=self.engine)
 
+        # Writes from threads sharing this store are serialized (SQLite allows
+        # one writer at a time), and person IDs come from one allocator so
+        # batches that pre-assign IDs never collide with other inserts.
+        self._write_lock = threading.RLock()
+        self._id_lock = threading.Lock()
+        self._next_person_id = 1
+        self.sync_person_ids()
+
+    def _create_missing_indexes(self):
+        """Create declared indexes that an existing database predates.
+
+        ``create_all`` only creates indexes along with a new table, so
+        indexes added to a model later are created here.
+        """
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+    def _create_write_triggers(self):
+        """Create the triggers that bump ``write_generation`` on every change."""
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("INSERT OR IGNORE INTO write_generation (id, generation) VALUES (1, 0)")
+            for table in (PersonDB.__table__, RelationshipDB.__table__, PartnershipDB.__table__):
+                for operation in ("INSERT", "UPDATE", "DELETE"):
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER IF NOT EXISTS {table.name}_{operation.lower()}_generation "
+                        f"AFTER {operation} ON {table.name} "
+                        "BEGIN UPDATE write_generation SET generation = generation + 1 WHERE id = 1; END"
+                    )
+
+    def write_generation(self, session: Optional[Session] = None) -> int:
+        """Get a counter that changes whenever people or their links change.
+
+        Cached results that include it in their key are never served after
+        a write, whichever process made it.
+
+        Args:
+            session: Session to read in, so the value matches what it sees
+
+        Returns:
+            Current write generation
+        """
+        stmt = select(WriteGenerationDB.generation).where(WriteGenerationDB.id == 1)
+        if session is not None:
+            return session.execute(stmt).scalar()
+        with self.engine.connect() as conn:
+            return conn.execute(stmt).scalar()
+
     def get_session(self) -> Session:
         """Get a database session."""
         return self.SessionLocal()
 
-    def add_person(self, person_or_given_name, surname=None, **kwargs) -> int:
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide one session and transaction for a series of writes.
+
+        Pass the yielded session to ``add_person``/``add_relationship``/
+        ``add_partnership`` so rows are only flushed (to obtain their IDs)
+        and committed once when the block exits. Rolls back on error.
+        Holds the store's write lock for the duration of the block.
+        """
+        with self._write_lock:
+            self.sync_person_ids()
+            session = self.SessionLocal(autoflush=False)
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    def sync_person_ids(self):
+        """Move the person ID allocator past the highest ID in the database.
+
+        Called when a batch of writes starts, so rows written by other
+        processes since the last batch are skipped. The allocator never
+        moves backwards, so IDs already handed out stay reserved.
+        """
+        with self.engine.connect() as conn:
+            max_id = conn.execute(select(func.max(PersonDB.id))).scalar()
+        with self._id_lock:
+            self._next_person_id = max(self._next_person_id, (max_id or 0) + 1)
+
+    def allocate_person_id(self) -> int:
+        """Reserve the next free person ID.
+
+        Safe to call from several threads. IDs are handed out from memory;
+        the database maximum is only re-read by :meth:`sync_person_ids`.
+
+        Returns:
+            Person ID no other caller of this store will receive
+        """
+        with self._id_lock:
+            person_id = self._next_person_id
+            self._next_person_id += 1
+            return person_id
+
+    def _insert(self, table, values: dict, session: Optional[Session] = None) -> int:
+        """Insert one row with a Core ``INSERT`` and return its ID.
+
+        Nothing reads the new row back, so no ORM object is built or tracked.
+        The statement is built once per table and the row is bound as
+        parameters, so every call hits the same compiled-statement cache
+        entry. With a session from :meth:`session_scope` the insert joins its
+        transaction; otherwise it is committed on its own.
+        """
+        stmt = _INSERTS[table.name]
+        if session is not None:
+            return session.execute(stmt, values).inserted_primary_key[0]
+
+        with self._write_lock, self.engine.begin() as conn:
+            return conn.execute(stmt, values).inserted_primary_key[0]
+
+    def add_person(self, person_or_given_name, surname=None, session: Optional[Session] = None, **kwargs) -> int:
         """Add a person to the database.
 
         Can accept either a Person model object or individual parameters.
@@ -124,43 +306,103 @@ class StructuredStore:
         Args:
             person_or_given_name: Person model object OR given_name string
             surname: Surname (if using individual params)
+            session: Session from ``session_scope`` to write in (commits immediately if omitted)
             **kwargs: Additional person fields (generation, birth_year, etc.)
 
         Returns:
             ID of the created person
         """
-        with self.get_session() as session:
-            # Check if first arg is a Pydantic model
-            if hasattr(person_or_given_name, 'model_dump'):
-                person_dict = person_or_given_name.model_dump()
-                person_db = PersonDB(**{k: v for k, v in person_dict.items() if k != 'id'})
-            else:
-                # Individual parameters
-                person_db = PersonDB(
-                    given_name=person_or_given_name,
-                    surname=surname,
-                    middle_name=kwargs.get('middle_name'),
-                    maiden_name=kwargs.get('maiden_name'),
-                    birth_year=kwargs.get('birth_year'),
-                    death_year=kwargs.get('death_year'),
-                    generation=kwargs.get('generation'),
-                    confidence=kwargs.get('confidence', ConfidenceLevel.UNCERTAIN),
-                )
+        # Check if first arg is a Pydantic model
+        if hasattr(person_or_given_name, 'model_dump'):
+            person_dict = person_or_given_name.model_dump()
+            values = {k: v for k, v in person_dict.items() if k != 'id'}
+        else:
+            # Individual parameters
+            values = {
+                "given_name": person_or_given_name,
+                "surname": surname,
+                "middle_name": kwargs.get('middle_name'),
+                "maiden_name": kwargs.get('maiden_name'),
+                "birth_year": kwargs.get('birth_year'),
+                "death_year": kwargs.get('death_year'),
+                "generation": kwargs.get('generation'),
+                "confidence": kwargs.get('confidence', ConfidenceLevel.UNCERTAIN),
+            }
+
+        # A write outside session_scope is a batch of its own
+        if session is None:
+            self.sync_person_ids()
+        values["id"] = self.allocate_person_id()
+        return self._insert(PersonDB.__table__, values, session)
+
+    def find_person_ids(self, keys: Iterable[Tuple]) -> Dict[Tuple, int]:
+        """Look up several people by name and birth year in one query.
 
-            session.add(person_db)
-            session.commit()
-            session.refresh(person_db)
-            return person_db.id
+        Args:
+            keys: ``(given_name, surname, middle_name, birth_year)`` tuples
 
-    def search_person(self, given_name: str, surname: str) -> List[PersonDB]:
+        Returns:
+            Mapping of each key that matches a person to their ID (the
+            lowest ID on duplicates); keys with no match are left out
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(PersonDB.id, PersonDB.given_name, PersonDB.surname, PersonDB.middle_name, PersonDB.birth_year)
+                .where(tuple_(PersonDB.surname, PersonDB.given_name).in_({(key[1], key[0]) for key in keys}))
+                .order_by(PersonDB.id.desc())
+            )
+            # Descending so the lowest ID wins on duplicate keys
+            found = {tuple(row[1:]): row[0] for row in rows}
+        return {key: found[key] for key in keys if key in found}
+
+    def find_or_create_person(
+        self,
+        given_name: str,
+        surname: str,
+        middle_name: Optional[str] = None,
+        birth_year: Optional[int] = None,
+        **kwargs,
+    ) -> int:
+        """Get the ID of a person by name and birth year, adding them if missing.
+
+        Only for people a caller is itself responsible for creating; to refer
+        to people that must already exist, use :meth:`find_person_ids` and
+        treat a miss as an error.
+
+        Args:
+            given_name: Given name
+            surname: Surname
+            middle_name: Middle name
+            birth_year: Birth year
+            **kwargs: Additional person fields used if the person is created
+
+        Returns:
+            ID of the existing or newly created person
+        """
+        key = (given_name, surname, middle_name, birth_year)
+
+        with self._write_lock:
+            person_id = self.find_person_ids([key]).get(key)
+            if person_id is None:
+                person_id = self.add_person(
+                    given_name, surname, middle_name=middle_name, birth_year=birth_year, **kwargs
+                )
+            return person_id
+
+    def search_person(self, given_name: str, surname: str, limit: Optional[int] = 10) -> List[PersonDB]:
         """Search for a person by name.
 
         Args:
             given_name: Given name to search
             surname: Surname to search
+            limit: Maximum number of matches to return (None for all)
 
         Returns:
-            List of matching persons
+            List of matching persons, ordered by name, birth year and ID
         """
         with self.get_session() as session:
             return (
@@ -169,10 +411,14 @@ class StructuredStore:
                     PersonDB.given_name.ilike(f"%{given_name}%"),
                     PersonDB.surname.ilike(f"%{surname}%"),
                 )
+                .order_by(PersonDB.surname, PersonDB.given_name, PersonDB.birth_year, PersonDB.id)
+                .limit(limit)
                 .all()
             )
 
-    def add_relationship(self, rel_or_parent_id, child_id=None, relationship_type=None, confidence=None) -> int:
+    def add_relationship(
+        self, rel_or_parent_id, child_id=None, relationship_type=None, confidence=None, session: Optional[Session] = None
+    ) -> int:
         """Add a parent-child relationship.
 
         Can accept either a Relationship model object or individual parameters.
@@ -182,62 +428,105 @@ class StructuredStore:
             child_id: Child person ID (if using individual params)
             relationship_type: Type of relationship (if using individual params)
             confidence: Confidence level (if using individual params)
+            session: Session from ``session_scope`` to write in (commits immediately if omitted)
 
         Returns:
             ID of the created relationship
         """
-        with self.get_session() as session:
-            # Check if first arg is a Pydantic model
-            if hasattr(rel_or_parent_id, 'model_dump'):
-                rel_dict = rel_or_parent_id.model_dump()
-                rel_db = RelationshipDB(**{k: v for k, v in rel_dict.items() if k != 'id'})
-            else:
-                # Individual parameters
-                rel_db = RelationshipDB(
-                    parent_id=rel_or_parent_id,
-                    child_id=child_id,
-                    relationship_type=relationship_type,
-                    confidence=confidence if confidence else ConfidenceLevel.UNCERTAIN,
-                )
+        # Check if first arg is a Pydantic model
+        if hasattr(rel_or_parent_id, 'model_dump'):
+            rel_dict = rel_or_parent_id.model_dump()
+            values = {k: v for k, v in rel_dict.items() if k != 'id'}
+        else:
+            # Individual parameters
+            values = {
+                "parent_id": rel_or_parent_id,
+                "child_id": child_id,
+                "relationship_type": relationship_type,
+                "confidence": confidence if confidence else ConfidenceLevel.UNCERTAIN,
+            }
+
+        return self._insert(RelationshipDB.__table__, values, session)
+
+    def add_child(
+        self,
+        parent1_id: int,
+        parent2_id: Optional[int],
+        child_id: int,
+        relationship_type: str = "biological",
+        confidence=None,
+        session: Optional[Session] = None,
+    ):
+        """Link a child to both parents with a single multi-row INSERT.
 
-            session.add(rel_db)
-            session.commit()
-            session.refresh(rel_db)
-            return rel_db.id
+        A missing (None) or repeated parent only gets one row.
 
-    def add_partnership(self, partnership_or_person1_id, person2_id=None, partnership_type="marriage", **kwargs) -> int:
+        Args:
+            parent1_id: First parent person ID
+            parent2_id: Second parent person ID (None if unknown)
+            child_id: Child person ID
+            relationship_type: Type of relationship (default: biological)
+            confidence: Confidence level
+            session: Session from ``session_scope`` to write in (commits immediately if omitted)
+        """
+        stmt = insert(RelationshipDB.__table__).values([
+            {
+                "parent_id": parent_id,
+                "child_id": child_id,
+                "relationship_type": relationship_type,
+                "confidence": confidence if confidence else ConfidenceLevel.UNCERTAIN,
+            }
+            for parent_id in self._parent_ids(parent1_id, parent2_id)
+        ])
+
+        if session is not None:
+            session.execute(stmt)
+        else:
+            with self._write_lock, self.engine.begin() as conn:
+                conn.execute(stmt)
+
+    @staticmethod
+    def _parent_ids(*parent_ids) -> list:
+        """Distinct, known parent IDs in the order given."""
+        return list(dict.fromkeys(p for p in parent_ids if p is not None))
+
+    def add_partnership(
+        self,
+        partnership_or_person1_id,
+        person2_id=None,
+        partnership_type="marriage",
+        session: Optional[Session] = None,
+        **kwargs,
+    ) -> int:
         """Add a partnership/marriage.
 
         Args:
             partnership_or_person1_id: Partnership model OR person1_id int
             person2_id: Second person ID (if using individual params)
             partnership_type: Type of partnership (default: marriage)
+            session: Session from ``session_scope`` to write in (commits immediately if omitted)
             **kwargs: Additional partnership fields
 
         Returns:
             ID of the created partnership
         """
-        with self.get_session() as session:
-            # Check if first arg is a Pydantic model
-            if hasattr(partnership_or_person1_id, 'model_dump'):
-                part_dict = partnership_or_person1_id.model_dump()
-                part_db = PartnershipDB(**{k: v for k, v in part_dict.items() if k != 'id'})
-            else:
-                # Individual parameters
-                part_db = PartnershipDB(
-                    person1_id=partnership_or_person1_id,
-                    person2_id=person2_id,
-                    partnership_type=partnership_type,
-                    start_year=kwargs.get('start_year'),
-                    end_year=kwargs.get('end_year'),
-                    sequence_number=kwargs.get('sequence_number'),
-                    confidence=kwargs.get('confidence', ConfidenceLevel.UNCERTAIN),
-                )
-
-            session.add(part_db)
-            session.commit()
-            session.refresh(part_db)
-            return part_db.id
+        # Check if first arg is a Pydantic model
+        if hasattr(partnership_or_person1_id, 'model_dump'):
+            part_dict = partnership_or_person1_id.model_dump()
+            values = {k: v for k, v in part_dict.items() if k != 'id'}
+        else:
+            # Individual parameters
+            values = {
+                "person1_id": partnership_or_person1_id,
+                "person2_id": person2_id,
+                "partnership_type": partnership_type,
+                "start_year": kwargs.get('start_year'),
+                "end_year": kwargs.get('end_year'),
+                "sequence_number": kwargs.get('sequence_number'),
+                "confidence": kwargs.get('confidence', ConfidenceLevel.UNCERTAIN),
+            }
+
+        return self._insert(PartnershipDB.__table__, values, session)
 
     def get_relationships(self, person_id: int) -> List[RelationshipDB]:
         """Get all parent-child relationships for a person.
@@ -292,7 +581,7 @@ class StructuredStore:
         Returns:
             ID of the created fact
         """
-        with self.get_session() as session:
+        with self._write_lock, self.get_session() as session:
             fact = FactDB(
                 person_id=person_id,
                 fact_type=fact_type,
@@ -317,8 +606,6 @@ class StructuredStore:
         Returns:
             Person Pydantic model if found, None otherwise
         """
-        from ..database.models import Person
-
         with self.get_session() as session:
             person_db = (
                 session.query(PersonDB)
@@ -354,8 +641,6 @@ class StructuredStore:
         Returns:
             Person Pydantic model if found, None otherwise
         """
-        from ..database.models import Person
-
         with self.get_session() as session:
             person_db = session.query(PersonDB).filter(PersonDB.id == person_id).first()
 
@@ -418,6 +703,23 @@ class StructuredStore:
             )
             return exists is not None
 
+    def get_table_counts(self) -> dict:
+        """Count people, relationships and partnerships in a single query.
+
+        Returns:
+            Dictionary with ``people``, ``relationships`` and ``partnerships`` totals
+        """
+        stmt = select(
+            *(
+                select(func.count()).select_from(model.__table__).scalar_subquery()
+                for model in (PersonDB, RelationshipDB, PartnershipDB)
+            )
+        )
+        with self.engine.connect() as conn:
+            people, relationships, partnerships = conn.execute(stmt).one()
+
+        return {"people": people, "relationships": relationships, "partnerships": partnerships}
+
     def get_all_people(self) -> List[PersonDB]:
         """Get all people from the database.
 
@@ -429,7 +731,7 @@ class StructuredStore:
 
     def clear_all_data(self):
         """Clear all data from the database. Use with caution!"""
-        with self.get_session() as session:
+        with self._write_lock, self.get_session() as session:
             session.query(FactDB).delete()
             session.query(PartnershipDB).delete()
             session.query(RelationshipDB).delete()
@@ -437,3 +739,298 @@ class StructuredStore:
             session.query(CitationDB).delete()
             session.commit()
             print("All structured data cleared from database")
+
+
+@lru_cache(maxsize=1)
+def get_default_store() -> StructuredStore:
+    """Get the shared store for the configured database.
+
+    Scripts run in the same process reuse one engine and its connection pool
+    instead of each building their own.
+
+    Returns:
+        Cached StructuredStore instance
+    """
+    return StructuredStore(get_settings())
+
+
+class BatchStore:
+    """Buffers people, relationships and partnerships for one bulk insert.
+
+    Person IDs are reserved up front from the store's allocator so callers
+    can link relationships and partnerships before anything is written.
+    Nothing reaches the database until :meth:`flush` is called.
+
+    Queued rows are plain tuples in the column order below, which is also
+    the order of the ``INSERT`` placeholders.
+    """
+
+    PERSON_COLUMNS = (
+        "id", "given_name", "surname", "middle_name", "maiden_name",
+        "birth_year", "death_year", "generation", "confidence",
+    )
+    RELATIONSHIP_COLUMNS = ("parent_id", "child_id", "relationship_type", "confidence")
+    PARTNERSHIP_COLUMNS = (
+        "person1_id", "person2_id", "partnership_type",
+        "start_year", "end_year", "sequence_number", "confidence",
+    )
+
+    def __init__(self, store: StructuredStore):
+        """Initialize batch on top of a structured store.
+
+        Args:
+            store: Structured store the batch is written to
+        """
+        self.store = store
+
+        self._people: List[tuple] = []
+        self._relationships: List[tuple] = []
+        self._partnerships: List[tuple] = []
+
+        # Natural keys of rows already stored (or queued), loaded on first use
+        self._known_people: Optional[dict] = None
+        self._known_relationships: Optional[set] = None
+        self._known_partnerships: Optional[set] = None
+
+    def _load_known(self):
+        """Read the natural keys of existing rows, one query per table."""
+        if self._known_people is not None:
+            return
+
+        with self.store.engine.connect() as conn:
+            self._known_people = {
+                tuple(row[1:]): row[0]
+                for row in conn.execute(select(PersonDB.id, *self._person_key_columns()))
+            }
+            self._known_relationships = {
+                tuple(row)
+                for row in conn.execute(
+                    select(RelationshipDB.parent_id, RelationshipDB.child_id, RelationshipDB.relationship_type)
+                )
+            }
+            self._known_partnerships = {
+                frozenset(row)
+                for row in conn.execute(select(PartnershipDB.person1_id, PartnershipDB.person2_id))
+            }
+
+    @staticmethod
+    def _person_key_columns():
+        return (
+            PersonDB.given_name,
+            PersonDB.middle_name,
+            PersonDB.surname,
+            PersonDB.birth_year,
+            PersonDB.death_year,
+            PersonDB.generation,
+        )
+
+    @staticmethod
+    def _person_key(given_name: str, surname: str, kwargs: dict) -> tuple:
+        """Natural key of a person, in ``_person_key_columns`` order."""
+        return (
+            given_name,
+            kwargs.get('middle_name'),
+            surname,
+            kwargs.get('birth_year'),
+            kwargs.get('death_year'),
+            kwargs.get('generation'),
+        )
+
+    def find_person(self, given_name: str, surname: str, **kwargs) -> Optional[int]:
+        """Look up a stored or queued person by name, life dates and generation.
+
+        The generation tells apart a parent and child of the same name when
+        neither has known dates.
+
+        Args:
+            given_name: Given name
+            surname: Surname
+            **kwargs: middle_name, birth_year, death_year and generation (missing means None)
+
+        Returns:
+            ID of the matching person, or None if there is none
+        """
+        self._load_known()
+        return self._known_people.get(self._person_key(given_name, surname, kwargs))
+
+    def add_person(self, given_name: str, surname: str, **kwargs) -> int:
+        """Queue a person for insertion.
+
+        Args:
+            given_name: Given name
+            surname: Surname
+            **kwargs: Additional person fields (generation, birth_year, etc.)
+
+        Returns:
+            ID the person will have once the batch is flushed
+        """
+        # First person of a new batch: skip IDs other writers have taken
+        if not self._people:
+            self.store.sync_person_ids()
+        person_id = self.store.allocate_person_id()
+
+        self._people.append((
+            person_id,
+            given_name,
+            surname,
+            kwargs.get('middle_name'),
+            kwargs.get('maiden_name'),
+            kwargs.get('birth_year'),
+            kwargs.get('death_year'),
+            kwargs.get('generation'),
+            kwargs.get('confidence', ConfidenceLevel.UNCERTAIN).name,
+        ))
+        if self._known_people is not None:
+            self._known_people.setdefault(self._person_key(given_name, surname, kwargs), person_id)
+        return person_id
+
+    def add_relationship(self, parent_id: int, child_id: int, relationship_type: str, confidence=None):
+        """Queue a parent-child relationship for insertion.
+
+        Relationships that are already stored or queued are skipped.
+
+        Args:
+            parent_id: Parent person ID
+            child_id: Child person ID
+            relationship_type: Type of relationship
+            confidence: Confidence level
+        """
+        self._load_known()
+        key = (parent_id, child_id, relationship_type)
+        if key in self._known_relationships:
+            return
+        self._known_relationships.add(key)
+
+        self._relationships.append((
+            parent_id,
+            child_id,
+            relationship_type,
+            (confidence or ConfidenceLevel.UNCERTAIN).name,
+        ))
+
+    def add_child(
+        self,
+        parent1_id: int,
+        parent2_id: Optional[int],
+        child_id: int,
+        relationship_type: str = "biological",
+        confidence=None,
+    ):
+        """Queue a child's relationships to both parents.
+
+        A missing (None) or repeated parent only gets one row.
+
+        Args:
+            parent1_id: First parent person ID
+            parent2_id: Second parent person ID (None if unknown)
+            child_id: Child person ID
+            relationship_type: Type of relationship (default: biological)
+            confidence: Confidence level
+        """
+        for parent_id in StructuredStore._parent_ids(parent1_id, parent2_id):
+            self.add_relationship(parent_id, child_id, relationship_type, confidence)
+
+    def add_partnership(self, person1_id: int, person2_id: int, partnership_type: str = "marriage", **kwargs):
+        """Queue a partnership/marriage for insertion.
+
+        Partnerships between two people who already have one are skipped.
+
+        Args:
+            person1_id: First person ID
+            person2_id: Second person ID
+            partnership_type: Type of partnership (default: marriage)
+            **kwargs: Additional partnership fields
+        """
+        self._load_known()
+        key = frozenset((person1_id, person2_id))
+        if key in self._known_partnerships:
+            return
+        self._known_partnerships.add(key)
+
+        self._partnerships.append((
+            person1_id,
+            person2_id,
+            partnership_type,
+            kwargs.get('start_year'),
+            kwargs.get('end_year'),
+            kwargs.get('sequence_number'),
+            kwargs.get('confidence', ConfidenceLevel.UNCERTAIN).name,
+        ))
+
+    def pending_counts(self) -> dict:
+        """Number of queued rows per table.
+
+        Returns:
+            Dictionary with ``people``, ``relationships`` and ``partnerships`` counts
+        """
+        return {
+            "people": len(self._people),
+            "relationships": len(self._relationships),
+            "partnerships": len(self._partnerships),
+        }
+
+    def _indexes_to_rebuild(self, tables) -> list:
+        """Secondary indexes worth dropping for this flush.
+
+        Rebuilding an index from scratch only beats updating it row by row
+        when the batch is larger than what the table already holds (e.g. an
+        initial load), so smaller batches keep their indexes.
+        """
+        indexed = [(table, rows) for table, _, rows in tables if rows and table.indexes]
+        if not indexed:
+            return []
+
+        stored = self.store.get_table_counts()
+        return [
+            index
+            for table, rows in indexed
+            if len(rows) > stored[table.name]
+            for index in table.indexes
+        ]
+
+    @staticmethod
+    def _insert_sql(table, columns) -> str:
+        """``INSERT`` with positional placeholders for ``columns``."""
+        return (
+            f"INSERT INTO {table.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+
+    def flush(self):
+        """Write all queued rows in a single transaction and clear the batch.
+
+        The queued tuples are handed straight to the driver (one executemany
+        per table), skipping ORM objects and per-row parameter dicts, since
+        nothing reads the rows back. Rows already stored were filtered out
+        when they were queued, so any clash (e.g. a person ID another writer
+        took in the meantime) raises and rolls back the whole batch rather
+        than attaching queued relationships to someone else.
+
+        For bulk loads that outweigh the existing data, the tables' secondary
+        indexes are dropped first and rebuilt once afterwards; they are
+        recreated even if the insert fails.
+        """
+        tables = (
+            (PersonDB.__table__, self.PERSON_COLUMNS, self._people),
+            (RelationshipDB.__table__, self.RELATIONSHIP_COLUMNS, self._relationships),
+            (PartnershipDB.__table__, self.PARTNERSHIP_COLUMNS, self._partnerships),
+        )
+
+        with self.store._write_lock:
+            rebuild = self._indexes_to_rebuild(tables)
+            try:
+                with self.store.engine.begin() as conn:
+                    for index in rebuild:
+                        index.drop(conn, checkfirst=True)
+                    for table, columns, rows in tables:
+                        if rows:
+                            conn.exec_driver_sql(self._insert_sql(table, columns), rows)
+            finally:
+                if rebuild:
+                    with self.store.engine.begin() as conn:
+                        for index in rebuild:
+                            index.create(conn, checkfirst=True)
+
+        self._people.clear()
+        self._relationships.clear()
+        self._partnerships.clear()
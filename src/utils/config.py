@@ -1,6 +1,7 @@
 """Configuration management for the genealogy system."""
 
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,10 +10,18 @@ class Settings(BaseSettings):
 
     # Structured Database
     structured_db_path: Path = Path("./data/structured_db/genealogy.db")
+    # Connections kept open per store; sized for run_all.py's thread pool
+    db_pool_size: int = 8
+    # PRAGMA synchronous for the SQLite file. NORMAL (with WAL) skips the
+    # fsync on each commit; FULL makes every commit durable at that cost.
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
 
     # API Settings
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    # Longest time computed responses (lineage paths, graphs, the surname
+    # list) are kept; any database write drops them sooner. 0 disables
+    api_cache_ttl: int = 300
 
     # Application Settings
     app_title: str = "Carpenter Family Genealogy"
@@ -1,5 +1,6 @@
 """Family tree visualization using Plotly."""
 
+from collections import deque
 from typing import Dict, List, Tuple, Optional, Set
 import networkx as nx
 import plotly.graph_objects as go
@@ -154,7 +155,6 @@ class FamilyTreeVisualizer:
             root_nodes = [list(G.nodes)[0]]
 
         # BFS to assign generations
-        from collections import deque
         queue = deque([(node, 0) for node in root_nodes])
         visited = set()
 
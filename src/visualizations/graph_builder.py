@@ -1,24 +1,36 @@
 """Graph builder for family tree visualization."""
 
-from typing import List, Optional, Set, Dict, Tuple
+from typing import FrozenSet, List, Optional, Set, Dict, Tuple
 import networkx as nx
+from sqlalchemy import String, and_, case, cast, func, or_, select
 from sqlalchemy.orm import Session
 
 from ..database.structured_store import StructuredStore, PersonDB, RelationshipDB, PartnershipDB
+from ..utils.cache import TTLCache
 from ..utils.config import Settings
 
 
 class FamilyGraphBuilder:
     """Builds NetworkX graph from genealogy database."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, store: Optional[StructuredStore] = None):
         """Initialize graph builder.
 
         Args:
             settings: Application settings
+            store: Store to read from, so its engine and connection pool are
+                shared (a new store is built from ``settings`` if omitted)
         """
         self.settings = settings
-        self.store = StructuredStore(settings)
+        self.store = store if store is not None else StructuredStore(settings)
+
+        # Cached results are keyed on the store's write generation (read
+        # before computing them), so any write to the database invalidates
+        # them; API_CACHE_TTL only bounds how long entries are kept.
+        # Sorted surname list, see get_all_surnames
+        self._surnames_cache = TTLCache(maxsize=1, ttl=settings.api_cache_ttl)
+        # Ancestor/descendant sets per root, see _get_relatives
+        self._relatives_cache = TTLCache(maxsize=1024, ttl=settings.api_cache_ttl)
 
     def build_graph(
         self,
@@ -54,36 +66,52 @@ class FamilyGraphBuilder:
                 )
             else:
                 # Get all people
-                people = session.query(PersonDB).all()
-                person_ids = {p.id for p in people}
+                person_ids = set(session.scalars(select(PersonDB.id)))
 
             # Apply surname filter if specified
             if surname_filter:
-                people = session.query(PersonDB).filter(
-                    PersonDB.id.in_(person_ids),
-                    PersonDB.surname == surname_filter
-                ).all()
-                person_ids = {p.id for p in people}
-
-            # Add nodes for each person
-            for person_id in person_ids:
-                person = session.query(PersonDB).get(person_id)
-                if person:
+                person_ids = set(session.scalars(
+                    select(PersonDB.id).where(
+                        PersonDB.id.in_(person_ids),
+                        PersonDB.surname == surname_filter
+                    )
+                ))
+
+            # Add nodes for each person, streamed from the database in
+            # batches rather than loaded all at once or fetched one by one
+            people = select(PersonDB).order_by(PersonDB.id)
+            if root_person_id or surname_filter:
+                people = people.where(PersonDB.id.in_(person_ids))
+            for batch in session.execute(people.execution_options(yield_per=1000)).scalars().partitions():
+                for person in batch:
                     self._add_person_node(G, person)
 
-            # Add edges for parent-child relationships
-            relationships = session.query(RelationshipDB).filter(
-                RelationshipDB.parent_id.in_(person_ids),
-                RelationshipDB.child_id.in_(person_ids),
-            ).all()
-
-            for rel in relationships:
-                G.add_edge(
-                    rel.parent_id,
-                    rel.child_id,
-                    edge_type="parent_child",
-                    relationship_type=rel.relationship_type,
-                    confidence=rel.confidence.value if rel.confidence else "uncertain",
+            # Add edges for parent-child relationships, also in batches
+            relationships = session.execute(
+                select(
+                    RelationshipDB.parent_id,
+                    RelationshipDB.child_id,
+                    RelationshipDB.relationship_type,
+                    RelationshipDB.confidence,
+                )
+                .where(
+                    RelationshipDB.parent_id.in_(person_ids),
+                    RelationshipDB.child_id.in_(person_ids),
+                )
+                .execution_options(yield_per=1000)
+            )
+            for batch in relationships.partitions():
+                G.add_edges_from(
+                    (
+                        parent_id,
+                        child_id,
+                        {
+                            "edge_type": "parent_child",
+                            "relationship_type": relationship_type,
+                            "confidence": confidence.value if confidence else "uncertain",
+                        },
+                    )
+                    for parent_id, child_id, relationship_type, confidence in batch
                 )
 
             # Add partnership information as node attributes
@@ -127,10 +155,7 @@ class FamilyGraphBuilder:
             person: PersonDB object
         """
         # Build display name
-        full_name = person.given_name
-        if person.middle_name:
-            full_name += f" {person.middle_name}"
-        full_name += f" {person.surname}"
+        full_name = person.full_name
         if person.maiden_name:
             full_name += f" ({person.maiden_name})"
 
@@ -194,8 +219,8 @@ class FamilyGraphBuilder:
 
     def _get_descendants(
         self, session: Session, person_id: int, max_generations: Optional[int]
-    ) -> Set[int]:
-        """Recursively get all descendants of a person.
+    ) -> FrozenSet[int]:
+        """Get all descendants of a person, level by level.
 
         Args:
             session: Database session
@@ -205,27 +230,14 @@ class FamilyGraphBuilder:
         Returns:
             Set of descendant IDs
         """
-        descendants = set()
-        current_level = {person_id}
-        generation = 0
-
-        while current_level and (max_generations is None or generation < max_generations):
-            # Get children of current level
-            children = session.query(RelationshipDB.child_id).filter(
-                RelationshipDB.parent_id.in_(current_level)
-            ).all()
-
-            child_ids = {c[0] for c in children}
-            descendants.update(child_ids)
-            current_level = child_ids
-            generation += 1
-
-        return descendants
+        return self._get_relatives(
+            session, person_id, max_generations, RelationshipDB.parent_id, RelationshipDB.child_id
+        )
 
     def _get_ancestors(
         self, session: Session, person_id: int, max_generations: Optional[int]
-    ) -> Set[int]:
-        """Recursively get all ancestors of a person.
+    ) -> FrozenSet[int]:
+        """Get all ancestors of a person, level by level.
 
         Args:
             session: Database session
@@ -235,22 +247,47 @@ class FamilyGraphBuilder:
         Returns:
             Set of ancestor IDs
         """
-        ancestors = set()
+        return self._get_relatives(
+            session, person_id, max_generations, RelationshipDB.child_id, RelationshipDB.parent_id
+        )
+
+    def _get_relatives(
+        self,
+        session: Session,
+        person_id: int,
+        max_generations: Optional[int],
+        from_column,
+        to_column,
+    ) -> FrozenSet[int]:
+        """Walk relationships from ``from_column`` to ``to_column`` breadth-first.
+
+        Each level only expands people not reached before, so shared
+        ancestors are walked once and cycles end. Results are cached per
+        (direction, person, depth) until the next write to the database, so
+        repeated graph builds around the same root skip the walk.
+        """
+        key = (self.store.write_generation(session), to_column.key, person_id, max_generations)
+        relatives = self._relatives_cache.get(key)
+        if relatives is not None:
+            return relatives
+
+        relatives = set()
+        expanded = {person_id}
         current_level = {person_id}
         generation = 0
 
         while current_level and (max_generations is None or generation < max_generations):
-            # Get parents of current level
-            parents = session.query(RelationshipDB.parent_id).filter(
-                RelationshipDB.child_id.in_(current_level)
-            ).all()
+            rows = session.query(to_column).filter(from_column.in_(current_level)).all()
 
-            parent_ids = {p[0] for p in parents}
-            ancestors.update(parent_ids)
-            current_level = parent_ids
+            next_ids = {r[0] for r in rows}
+            relatives.update(next_ids)
+            current_level = next_ids - expanded
+            expanded.update(current_level)
             generation += 1
 
-        return ancestors
+        relatives = frozenset(relatives)
+        self._relatives_cache.set(key, relatives)
+        return relatives
 
     def _get_spouses(self, session: Session, person_ids: Set[int]) -> Set[int]:
         """Get all spouses of the given people.
@@ -284,105 +321,123 @@ class FamilyGraphBuilder:
             Sorted list of surnames
         """
         with self.store.get_session() as session:
-            surnames = session.query(PersonDB.surname).distinct().all()
-            return sorted([s[0] for s in surnames if s[0]])
-
-    def search_people(self, search_term: str) -> List[Dict]:
+            generation = self.store.write_generation(session)
+            surnames = self._surnames_cache.get(generation)
+            if surnames is None:
+                rows = session.query(PersonDB.surname).distinct().all()
+                surnames = sorted([s[0] for s in rows if s[0]])
+                self._surnames_cache.set(generation, surnames)
+
+        # A copy, so callers can't change the cached list
+        return list(surnames)
+
+    @staticmethod
+    def _search_filter(search_term: str, search_words: List[str]):
+        """Build the WHERE clause for a people search (see ``search_people``)."""
+        # Single words match any name field
+        if len(search_words) == 1:
+            return or_(
+                PersonDB.given_name.ilike(f"%{search_term}%"),
+                PersonDB.middle_name.ilike(f"%{search_term}%"),
+                PersonDB.surname.ilike(f"%{search_term}%"),
+            )
+
+        # Multiple words must each appear somewhere in the full name
+        return and_(*(PersonDB.full_name.ilike(f"%{word}%") for word in search_words))
+
+    def search_people(self, search_term: str, limit: Optional[int] = 200, offset: int = 0) -> List[Dict]:
         """Search for people by name.
 
+        Relevance, the display name and the ordering are all computed in
+        SQL, so only the requested page of matches is read.
+
         Args:
             search_term: Search term (matches given name, middle name, or surname)
                         Supports multi-word searches (e.g., "William Troy Keenum")
+            limit: Maximum number of results (None for all)
+            offset: Number of results to skip, for pagination
 
         Returns:
             List of person dictionaries with id, name, and dates, sorted by relevance
         """
+        search_words = search_term.strip().split()
+        if not search_words:
+            return []
+        search_lower = search_term.lower()
+
+        def starts_with(column):
+            return func.substr(column, 1, len(search_lower)) == search_lower
+
+        # Relevance score (lower is better)
+        if len(search_words) > 1:
+            full_name = func.lower(PersonDB.full_name)
+            relevance = case(
+                (full_name == search_lower, 1),  # exact full name match
+                (starts_with(full_name), 2),  # full name starts with search
+                else_=3,  # all words present
+            )
+        else:
+            given = func.lower(PersonDB.given_name)
+            middle = func.lower(PersonDB.middle_name)
+            surname = func.lower(PersonDB.surname)
+            relevance = case(
+                (or_(given == search_lower, surname == search_lower), 1),  # exact match
+                (or_(starts_with(given), starts_with(surname)), 2),  # starts with
+                (middle == search_lower, 3),  # exact match in middle name
+                (starts_with(middle), 4),  # starts with in middle name
+                else_=5,  # contains somewhere
+            )
+
+        # Display name: full name plus "(birth-death)" when either year is known
+        birth = func.nullif(PersonDB.birth_year, 0)
+        death = func.nullif(PersonDB.death_year, 0)
+        name = PersonDB.full_name + case(
+            (
+                or_(birth.is_not(None), death.is_not(None)),
+                " ("
+                + func.coalesce(cast(birth, String), "?")
+                + "-"
+                + func.coalesce(cast(death, String), "?")
+                + ")",
+            ),
+            else_="",
+        )
+
         with self.store.get_session() as session:
-            # Split search term into words for multi-word matching
-            search_words = search_term.strip().split()
-            search_lower = search_term.lower()
-
-            # For single word searches, use the optimized SQL filter
-            if len(search_words) == 1:
-                people = session.query(PersonDB).filter(
-                    (PersonDB.given_name.ilike(f"%{search_term}%"))
-                    | (PersonDB.middle_name.ilike(f"%{search_term}%"))
-                    | (PersonDB.surname.ilike(f"%{search_term}%"))
-                ).limit(200).all()
-            else:
-                # For multi-word searches, get more candidates and filter in Python
-                # Build an OR filter for any field containing any word
-                from sqlalchemy import or_
-                word_filters = []
-                for word in search_words:
-                    word_filters.extend([
-                        PersonDB.given_name.ilike(f"%{word}%"),
-                        PersonDB.middle_name.ilike(f"%{word}%"),
-                        PersonDB.surname.ilike(f"%{word}%")
-                    ])
-                people = session.query(PersonDB).filter(or_(*word_filters)).limit(500).all()
-
-            results = []
-
-            for p in people:
-                # Build full name including middle name if present
-                full_name_parts = [p.given_name or ""]
-                if p.middle_name:
-                    full_name_parts.append(p.middle_name)
-                full_name_parts.append(p.surname or "")
-                full_name_without_dates = " ".join(full_name_parts)
-
-                # For multi-word search, check if all words are present in full name
-                if len(search_words) > 1:
-                    full_name_lower = full_name_without_dates.lower()
-                    if not all(word.lower() in full_name_lower for word in search_words):
-                        continue  # Skip if not all words match
-
-                # Add birth/death years to display name
-                full_name = full_name_without_dates
-                if p.birth_year or p.death_year:
-                    birth = str(p.birth_year) if p.birth_year else "?"
-                    death = str(p.death_year) if p.death_year else "?"
-                    full_name += f" ({birth}-{death})"
-
-                # Calculate relevance score (lower is better)
-                given_lower = (p.given_name or "").lower()
-                middle_lower = (p.middle_name or "").lower()
-                surname_lower = (p.surname or "").lower()
-                full_name_lower = full_name_without_dates.lower()
-
-                # Check for multi-word exact or starts-with match
-                if len(search_words) > 1:
-                    if full_name_lower == search_lower:
-                        relevance = 1  # exact full name match
-                    elif full_name_lower.startswith(search_lower):
-                        relevance = 2  # full name starts with search
-                    else:
-                        relevance = 3  # all words present
-                else:
-                    # Single word relevance scoring
-                    if given_lower == search_lower or surname_lower == search_lower:
-                        relevance = 1  # exact match
-                    elif given_lower.startswith(search_lower) or surname_lower.startswith(search_lower):
-                        relevance = 2  # starts with
-                    elif middle_lower == search_lower:
-                        relevance = 3  # exact match in middle name
-                    elif middle_lower.startswith(search_lower):
-                        relevance = 4  # starts with in middle name
-                    else:
-                        relevance = 5  # contains somewhere
-
-                results.append({
-                    "id": p.id,
-                    "name": full_name,
-                    "given_name": p.given_name,
-                    "surname": p.surname,
-                    "birth_year": p.birth_year,
-                    "death_year": p.death_year,
-                    "relevance": relevance,
-                })
-
-            # Sort by relevance, then alphabetically by name
-            results.sort(key=lambda x: (x["relevance"], x["name"]))
-
-            return results
+            rows = (
+                session.query(
+                    PersonDB.id,
+                    name.label("name"),
+                    PersonDB.given_name,
+                    PersonDB.surname,
+                    PersonDB.birth_year,
+                    PersonDB.death_year,
+                    relevance.label("relevance"),
+                )
+                .filter(self._search_filter(search_term, search_words))
+                # Sort by relevance, then alphabetically by name
+                .order_by(relevance, name, PersonDB.id)
+                .limit(limit)
+                .offset(offset)
+            )
+            return [row._asdict() for row in rows]
+
+    def count_search_matches(self, search_term: str) -> int:
+        """Count everyone ``search_people`` would match, ignoring pagination.
+
+        Args:
+            search_term: Search term, as for ``search_people``
+
+        Returns:
+            Number of matching people
+        """
+        search_words = search_term.strip().split()
+        if not search_words:
+            return 0
+
+        with self.store.get_session() as session:
+            return (
+                session.query(func.count(PersonDB.id))
+                .filter(self._search_filter(search_term, search_words))
+                .scalar()
+            )